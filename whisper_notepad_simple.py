@@ -11,75 +11,328 @@ Dependencies:
 - soundfile: Audio file I/O
 - openai: OpenAI API client
 - numpy: Array manipulation (used with sounddevice)
+- orjson (optional): Fast JSON parsing/serialization for the config file
 """
 
+import gc
 import os
+import re
 import sys
 import time
 import json
+import logging
+import mmap
+import queue
+import sqlite3
+import hashlib
+import importlib.util
+import asyncio
 import tempfile
 import threading
 from pathlib import Path
-from datetime import datetime
-import numpy as np
-import sounddevice as sd
-import soundfile as sf
-import openai
-import ffmpeg
+from functools import lru_cache, partial
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 import ssl
 
+# Use orjson for the config and prompt files when it's installed, otherwise the standard library
+try:
+    import orjson
+    
+    def _json_loads(data):
+        return orjson.loads(data)
+    
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+    
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+# numpy, sounddevice, soundfile, openai and datetime are imported where they are
+# first needed so the main window can appear before those packages load
+
 # Disable SSL verification globally
 ssl._create_default_https_context = ssl._create_unverified_context
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QPushButton, QTextEdit, QComboBox,
+    QApplication, QMainWindow, QWidget, QPushButton, QPlainTextEdit, QComboBox,
     QVBoxLayout, QHBoxLayout, QLabel, QFileDialog, QMessageBox, QGroupBox,
     QCheckBox, QMenu, QMenuBar, QStatusBar, QDialog, QLineEdit,
-    QSplitter, QFrame, QToolButton, QProgressBar, QStyle,
+    QSplitter, QFrame, QToolButton, QProgressBar, QStyle, QStyleFactory,
     QListWidget, QListWidgetItem, QTabWidget, QScrollArea
 )
-from PySide6.QtCore import Qt, QSettings, QTimer, Signal, QObject, Slot
-from PySide6.QtGui import QIcon, QFont, QClipboard, QPalette, QColor, QKeySequence, QPainter, QPixmap, QAction, QShortcut
+from PySide6.QtCore import Qt, QSettings, QTimer, Signal, QObject, Slot, QThreadPool, QStringListModel
+from PySide6.QtGui import QIcon, QFont, QClipboard, QPalette, QColor, QKeySequence, QPainter, QPixmap, QAction, QShortcut, QTextCursor
+
+log = logging.getLogger(__name__)
 
 # Constants
 APP_NAME = "Whisper Notepad Simple"
 APP_VERSION = "4"
 CONFIG_FILE = os.path.expanduser("~/.whisper_notepad_simple_config.json")
+
+# Config path resolved once (following any symlink, so saves replace the real file)
+CONFIG_PATH = Path(CONFIG_FILE).resolve()
+CONFIG_TMP_PATH = CONFIG_PATH.with_name(CONFIG_PATH.name + ".tmp")
+
+# Where a config file that could not be parsed is moved before the first save replaces it
+CONFIG_BACKUP_PATH = CONFIG_PATH.with_name(CONFIG_PATH.name + ".bak")
+
+# Local store of past transcriptions (plain text), only readable by the user
+TRANSCRIPTION_CACHE_FILE = os.path.expanduser("~/.whisper_notepad_simple_cache.sqlite")
 SYS_PROMPT_LIBRARY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "system-prompts", "sys-prompt-library.json")
-DEFAULT_CONFIG = {
-    "api_key": "",
-    "default_device": None,
-    "default_device_id": None,
-    "default_transformation": "Standard",
-    "custom_transformations": {},
-    "auto_transcribe": False,
-    "disable_ssl_verify": False
-}
 
-# Text transformation styles
-TEXT_TRANSFORMATIONS = {
-    "Standard": "You are a text formatting assistant. Your ONLY task is to take the raw text provided by the user and reformat it for clarity and readability. Specifically:\n\n1. Adjust spacing and paragraph structure for better readability\n2. Fix grammar, spelling, and punctuation errors\n3. Ensure proper capitalization and sentence structure\n4. Remove filler words, verbal tics, and repetitions\n5. Maintain the original meaning and all crucial information\n6. Organize ideas into logical paragraphs with appropriate headers where needed\n7. Make light edits for clarity where appropriate\n\nIMPORTANT: Do NOT respond as if you are an AI assistant. Do NOT add any commentary, explanations, or responses to the text. Simply return the reformatted version of the exact text provided. The output should ONLY be the reformatted text, nothing else.",
-    
-    "Minimal Cleanup": "Your task is to take the text submitted by the user and apply basic cleanup. Add missing punctuation, fix obvious typos, add appropriate paragraph breaks, and ensure proper spacing. Do not add any headers, commentary, or additional formatting. Return only the cleaned text with no additional text before or after.",
-    
-    "Email Format": "You are a text formatting assistant. Your ONLY task is to take the raw text provided by the user and reformat it into a professional email format. Specifically:\n\n1. Create a proper email structure with greeting and sign-off\n2. Organize content into clear paragraphs\n3. Fix grammar, spelling, and punctuation errors\n4. Remove filler words and verbal tics\n5. Maintain a professional tone throughout\n6. Keep the original meaning and all crucial information\n7. Add appropriate subject line if context allows\n\nIMPORTANT: Do NOT respond as if you are an AI assistant. Do NOT add any commentary, explanations, or responses to the text. Simply return the reformatted version as a professional email. The output should ONLY be the reformatted email text, nothing else.",
+
+class Config:
+    """Application settings, stored in CONFIG_FILE as a JSON object with one key per attribute."""
+    __slots__ = (
+        "api_key", "default_device", "default_device_id", "default_transformation",
+        "custom_transformations", "auto_transcribe", "disable_ssl_verify",
+        "cache_transcriptions", "_extra"
+    )
     
-    "Voice Prompt": "You are a text formatting assistant. Your ONLY task is to take the raw text provided by the user and reformat it into a clear, concise voice prompt suitable for AI voice assistants. Specifically:\n\n1. Make the text direct, clear, and conversational\n2. Remove unnecessary words and phrases\n3. Fix grammar and structure for natural speech patterns\n4. Format as a direct instruction or query\n5. Maintain the original intent and all crucial information\n6. Optimize for voice recognition systems\n\nIMPORTANT: Do NOT respond as if you are an AI assistant. Do NOT add any commentary, explanations, or responses to the text. Simply return the reformatted version as a voice prompt. The output should ONLY be the reformatted voice prompt, nothing else.",
+    # Accepted JSON types for each setting; other values are logged and replaced by the default
+    _FIELD_TYPES = {
+        "api_key": (str, type(None)),
+        "default_device": (str, type(None)),
+        "default_device_id": (int, type(None)),
+        "default_transformation": (str,),
+        "custom_transformations": (dict,),
+        "auto_transcribe": (bool,),
+        "disable_ssl_verify": (bool,),
+        "cache_transcriptions": (bool,),
+    }
     
-    "System Prompt": "You are a text formatting assistant. Your ONLY task is to take the raw text provided by the user and reformat it into a well-structured system prompt for AI systems. Specifically:\n\n1. Format as clear instructions for an AI system\n2. Organize into logical sections with appropriate structure\n3. Use clear, unambiguous language\n4. Include specific guidelines and constraints\n5. Define the AI's role and boundaries\n6. Maintain all crucial information from the original text\n7. Format with appropriate markdown or structure if needed\n\nIMPORTANT: Do NOT respond as if you are an AI assistant. Do NOT add any commentary, explanations, or responses to the text. Simply return the reformatted version as a system prompt. The output should ONLY be the reformatted system prompt, nothing else.",
+    def __init__(self):
+        # Defaults for a fresh config; an empty API key falls back to OPENAI_API_KEY
+        # when the client is created, so the environment key is never written to disk
+        self.api_key = ""
+        self.default_device = None
+        self.default_device_id = None
+        self.default_transformation = "Standard"
+        self.custom_transformations = {}
+        self.auto_transcribe = False
+        self.disable_ssl_verify = False
+        self.cache_transcriptions = True
+        
+        # Keys this version doesn't know about, kept so saving doesn't drop them
+        self._extra = {}
     
-    "Personal Email": "You are a text formatting assistant. Your ONLY task is to take the raw text provided by the user and reformat it into a friendly, personal email. Specifically:\n\n1. Create a warm, conversational tone\n2. Include appropriate casual greeting and sign-off\n3. Organize content into natural-sounding paragraphs\n4. Fix grammar, spelling, and punctuation errors\n5. Remove filler words and verbal tics\n6. Maintain the original meaning and all crucial information\n\nIMPORTANT: Do NOT respond as if you are an AI assistant. Do NOT add any commentary, explanations, or responses to the text. Simply return the reformatted version as a personal email. The output should ONLY be the reformatted email text, nothing else.",
+    @classmethod
+    def from_dict(cls, data):
+        """Build a Config from parsed JSON, using defaults for any missing or invalid keys."""
+        if not isinstance(data, dict):
+            raise ValueError("Config file does not contain a JSON object")
+        
+        config = cls()
+        for key, value in data.items():
+            if key == "device_rates":
+                # Written by older versions; sample rates are no longer persisted
+                continue
+            if key in cls._FIELD_TYPES:
+                # bool is an int subclass, so reject it explicitly for the device ID
+                if not isinstance(value, cls._FIELD_TYPES[key]) or (
+                    key == "default_device_id" and isinstance(value, bool)
+                ):
+                    log.warning("Ignoring invalid config value for %r: %r", key, value)
+                    continue
+                if key == "custom_transformations":
+                    # Keep the well-formed prompts and drop the rest
+                    value = {
+                        name: prompt for name, prompt in value.items()
+                        if isinstance(name, str) and isinstance(prompt, str)
+                    }
+                    if len(value) != len(data[key]):
+                        log.warning("Ignoring invalid entries in config key 'custom_transformations'")
+                setattr(config, key, value)
+            else:
+                config._extra[key] = value
+        return config
     
-    "Technical Documentation": "You are a text formatting assistant. Your ONLY task is to take the raw text provided by the user and reformat it into clear technical documentation. Specifically:\n\n1. Use proper technical writing style and structure\n2. Organize with appropriate headings and subheadings\n3. Use precise, unambiguous language\n4. Format code snippets, parameters, or technical terms appropriately\n5. Fix grammar, spelling, and punctuation errors\n6. Create logical flow with appropriate transitions\n7. Maintain all technical details and crucial information\n\nIMPORTANT: Do NOT respond as if you are an AI assistant. Do NOT add any commentary, explanations, or responses to the text. Simply return the reformatted version as technical documentation. The output should ONLY be the reformatted technical documentation, nothing else.",
+    def to_dict(self):
+        """Return the settings as a dict ready for JSON serialization."""
+        data = dict(self._extra)
+        for key in self.__slots__:
+            if not key.startswith("_"):
+                data[key] = getattr(self, key)
+        return data
+
+
+# Whisper model used for transcription (part of the transcription cache key)
+WHISPER_MODEL = "whisper-1"
+
+# Number of transcriptions kept in the local cache before the least recently used are evicted
+TRANSCRIPTION_CACHE_SIZE = 200
+
+# Frames per audio callback; small blocks keep capture start/stop latency low
+INPUT_BLOCKSIZE = 512
+
+# Seconds of audio held in the capture ring buffer; the writer thread must keep up within this window
+RING_BUFFER_SECONDS = 10
+
+# Sample rate used when re-encoding audio to Opus before upload (Whisper resamples to 16 kHz anyway)
+OPUS_SAMPLE_RATE = 16000
+
+# Length of the windowed-sinc low-pass filter applied before downsampling to OPUS_SAMPLE_RATE
+RESAMPLE_FILTER_TAPS = 101
+
+# Maximum number of chunk uploads in flight when transcribing large files
+MAX_CONCURRENT_UPLOADS = 8
+
+# With one of the pure cleanup styles selected, transcriptions shorter than this
+# are shown as-is instead of being sent to GPT; other styles always run
+MIN_CLEANUP_WORDS = 15
+CLEANUP_ONLY_STYLES = frozenset({"Standard", "Minimal Cleanup"})
+
+# Energy check run before uploading a recording: audio is split into short
+# frames and the RMS of each frame is measured
+SPEECH_FRAME_SECONDS = 0.03
+
+# Recordings whose loudest frame stays below this are treated as digital
+# silence and not uploaded; anything louder is sent, however quiet
+SILENCE_RMS_FLOOR = 8  # int16 amplitude, roughly -72 dBFS
+
+# Leading and trailing silence is trimmed relative to the recording itself: a
+# frame counts as sound once it is TRIM_NOISE_RATIO times the noise floor (the
+# quietest tenth of frames) or TRIM_PEAK_RATIO of the loudest frame, whichever
+# is lower, and this much audio is kept either side of the first and last one
+TRIM_NOISE_RATIO = 4  # about +12 dB over the noise floor
+TRIM_PEAK_RATIO = 0.05  # about -26 dB below the peak
+SPEECH_PADDING_SECONDS = 1.0
+
+# Zero-padded seconds for the recording time display
+SECONDS_LABELS = [f"{second:02d}" for second in range(60)]
+
+# Long transcripts are added to the raw pane in slices of this many characters
+RAW_TEXT_SLICE_SIZE = 4096
+
+# Cap on paragraphs kept in the raw pane
+RAW_TEXT_MAX_BLOCKS = 10000
+
+# OpenAI API keys start with "sk-" followed by at least 17 key characters
+API_KEY_PATTERN = re.compile(r"sk-[A-Za-z0-9_\-]{17,}")
+
+# Text transformation styles, kept in a data file and only parsed on first use
+TEXT_TRANSFORMATIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "system-prompts", "text-transformations.json")
+
+# Application-wide stylesheet; the text panes are styled by object name
+_APP_STYLESHEET = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 1ex;
+        padding-top: 10px;
+        background-color: #ffffff;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center;
+        padding: 0 5px;
+        background-color: #ffffff;
+    }
+    QPushButton {
+        background-color: #f0f0f0;
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        padding: 5px 10px;
+    }
+    QPushButton:hover {
+        background-color: #e0e0e0;
+        border: 1px solid #bbbbbb;
+    }
+    QPushButton:pressed {
+        background-color: #d0d0d0;
+    }
+    QPushButton:disabled {
+        background-color: #f8f8f8;
+        color: #aaaaaa;
+        border: 1px solid #dddddd;
+    }
+    QComboBox {
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        padding: 1px 18px 1px 3px;
+        min-width: 6em;
+        background-color: #ffffff;
+    }
+    QComboBox:hover {
+        border: 1px solid #bbbbbb;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 15px;
+        border-left-width: 1px;
+        border-left-color: #cccccc;
+        border-left-style: solid;
+        border-top-right-radius: 3px;
+        border-bottom-right-radius: 3px;
+    }
+    QSplitter::handle {
+        background-color: #cccccc;
+    }
+    QSplitter::handle:horizontal {
+        width: 4px;
+    }
+    QSplitter::handle:vertical {
+        height: 4px;
+    }
+    QCheckBox {
+        spacing: 5px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QPlainTextEdit#rawText {
+        background-color: #f8f8f8;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 8px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QPlainTextEdit#cleanText {
+        background-color: #ffffff;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        padding: 8px;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def get_text_transformations():
+    """Load the text transformation prompts, keyed by style name.
     
-    "Shakespearean Style": "You are a text formatting assistant. Your ONLY task is to take the raw text provided by the user and reformat it in the style of William Shakespeare. Specifically:\n\n1. Use Early Modern English vocabulary and grammar\n2. Incorporate Shakespearean phrases, metaphors, and expressions\n3. Structure with appropriate rhythm and flow\n4. Maintain the original meaning and all crucial information\n5. Use poetic devices where appropriate\n6. Include Shakespearean-style greetings and closings if relevant\n\nIMPORTANT: Do NOT respond as if you are an AI assistant. Do NOT add any commentary, explanations, or responses to the text. Simply return the reformatted version in Shakespearean style. The output should ONLY be the reformatted text, nothing else."
-}
+    The returned dict is shared, so custom transformations added to it persist for the session.
+    A missing or unreadable file yields an empty dict so the app can still start.
+    """
+    try:
+        transformations = _json_loads(Path(TEXT_TRANSFORMATIONS_FILE).read_bytes())
+        if not isinstance(transformations, dict):
+            raise ValueError("Text transformations file does not contain a JSON object")
+        return transformations
+    except (OSError, ValueError):
+        log.exception("Could not load text transformations from %s", TEXT_TRANSFORMATIONS_FILE)
+        return {}
+
 
 class RecordingThread(QObject):
     """Thread for handling audio recording to avoid UI freezing."""
     finished = Signal()
     error = Signal(str)
     
+    # Supported sample rates keyed by (device_id, channels), shared by all recordings
+    sample_rate_cache = {}
+    
     def __init__(self, device, sample_rate=16000, channels=1):
         super().__init__()
         self.device = device
@@ -87,17 +340,45 @@ class RecordingThread(QObject):
         self.channels = channels
         self.recording = False
         self.paused = False
-        self.frames = []
-        self.current_chunk = []
-        self.chunk_files = []
-        self.recording_duration = 0
-        self.start_time = time.time()
-        
-        # Create a temporary directory for chunks
-        self.temp_dir = tempfile.mkdtemp()
+        self.frames_written = 0
+        
+        # Captured audio is copied into a preallocated ring buffer and filled slices are
+        # handed to a writer thread that streams them into a single WAV file
+        self._ring = None
+        self._ring_write = 0
+        self._ring_flushed = 0
+        self._audio_queue = queue.Queue()
+        
+        # Ring positions counted without wrapping: where the current pass over the ring
+        # starts and how far the writer has got, so the callback can tell when it would
+        # overwrite audio that hasn't been written yet
+        self._ring_pass_start = 0
+        self._ring_drained = 0
+        self._frames_dropped = 0
+        self._gc_was_enabled = False
+        self._wav_file = None
+        self._wav_path = None
+        self._writer_thread = None
         
     def get_supported_sample_rate(self, device_id):
-        """Get a supported sample rate for the device."""
+        """Get a supported sample rate for the device, probing it only once per session."""
+        key = (device_id, self.channels)
+        if key not in self.sample_rate_cache:
+            rate = self._probe_sample_rate(device_id)
+            if rate is None:
+                return 16000  # Default fallback, not cached so the next recording probes again
+            self.sample_rate_cache[key] = rate
+        return self.sample_rate_cache[key]
+    
+    @property
+    def recording_duration(self):
+        """Seconds of audio written to the output file so far."""
+        return self.frames_written / self.sample_rate
+        
+    def _probe_sample_rate(self, device_id):
+        """Query PortAudio for a sample rate the device supports."""
+        import sounddevice as sd
+        
         try:
             # Try to get device info
             device_info = sd.query_devices(device_id, 'input')
@@ -122,47 +403,82 @@ class RecordingThread(QObject):
             # If no common rates work, return the lowest as a last resort
             return 8000
         except Exception as e:
-            print(f"Error determining supported sample rate: {e}")
-            return 16000  # Default fallback
+            log.warning("Error determining supported sample rate: %s", e)
+            return None
         
     def start_recording(self):
         """Start recording audio from the selected device."""
+        import numpy as np
+        import sounddevice as sd
+        import soundfile as sf
+        
         self.recording = True
         self.paused = False
-        self.frames = []
-        self.current_chunk = []
-        self.chunk_files = []
-        self.recording_duration = 0
-        self.start_time = time.time()
+        self.frames_written = 0
+        self._ring_pass_start = self._ring_drained = 0
+        self._frames_dropped = 0
         
         def callback(indata, frames, time_info, status):
+            # Runs on PortAudio's real-time thread: copy into the ring buffer without allocating
             if status:
-                print(f"Status: {status}")
+                log.warning("Audio input status: %s", status)
             if self.recording and not self.paused:
-                self.current_chunk.append(indata.copy())
-                
-                # Calculate recording duration and emit progress
-                current_time = time.time()
-                self.recording_duration = current_time - self.start_time
+                if self._ring_write + frames > len(self._ring):
+                    # Wrap around to the start of the ring
+                    self._flush_ring()
+                    self._ring_pass_start += len(self._ring)
+                    self._ring_write = self._ring_flushed = 0
+                if self._ring_pass_start + self._ring_write + frames - self._ring_drained > len(self._ring):
+                    # The writer is a whole ring behind (stalled disk); drop this block rather
+                    # than overwrite audio that is still waiting to be written
+                    if not self._frames_dropped:
+                        log.warning("Audio writer fell behind; dropping input until it catches up")
+                    self._frames_dropped += frames
+                    return
+                self._ring[self._ring_write:self._ring_write + frames] = indata
+                self._ring_write += frames
                 
-                # Check if current chunk has reached chunk_size
-                chunk_duration = len(self.current_chunk) * frames / self.sample_rate
-                if chunk_duration >= 60:  # 1 minute chunks
-                    self._save_current_chunk()
+                # Hand roughly one second of audio at a time to the writer thread
+                if self._ring_write - self._ring_flushed >= self.sample_rate:
+                    self._flush_ring()
         
         try:
             # Get a supported sample rate for this device
             self.sample_rate = self.get_supported_sample_rate(self.device)
-            print(f"Using sample rate: {self.sample_rate}")
+            log.info("Using sample rate: %s", self.sample_rate)
+            
+            self._ring = np.empty((self.sample_rate * RING_BUFFER_SECONDS, self.channels), dtype=np.int16)
+            self._ring_write = self._ring_flushed = 0
+            
+            # Open the output file up front and start the writer thread
+            fd, self._wav_path = tempfile.mkstemp(suffix='.wav')
+            os.close(fd)
+            self._wav_file = sf.SoundFile(
+                self._wav_path, mode='w',
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                subtype='PCM_16'
+            )
+            self._writer_thread = threading.Thread(target=self._write_queued_audio, daemon=True)
+            self._writer_thread.start()
             
             self.stream = sd.InputStream(
                 device=self.device,
                 channels=self.channels,
                 samplerate=self.sample_rate,
+                blocksize=INPUT_BLOCKSIZE,
+                dtype='int16',  # Matches the PCM_16 file, so blocks are written without conversion
+                latency='low',
                 callback=callback
             )
             self.stream.start()
+            
+            # Keep collector pauses from stalling the audio callback while recording
+            self._gc_was_enabled = gc.isenabled()
+            gc.disable()
         except Exception as e:
+            self.recording = False
+            self._discard_output_file()
             self.error.emit(f"Error starting recording: {str(e)}")
             
     def pause_recording(self):
@@ -174,7 +490,7 @@ class RecordingThread(QObject):
         self.paused = False
             
     def stop_recording(self):
-        """Stop recording and save the audio to a temporary file."""
+        """Stop recording and finalize the temporary audio file."""
         if hasattr(self, 'stream'):
             self.recording = False
             self.paused = False
@@ -182,95 +498,103 @@ class RecordingThread(QObject):
             self.stream.close()
             
             try:
-                # Save the final chunk if there's any data
-                if self.current_chunk:
-                    self._save_current_chunk()
+                # Hand over the last partial slice and let the writer thread flush the queue
+                self._flush_ring()
+                self._stop_writer()
                 
-                # Create a temporary file for the complete recording
-                fd, temp_path = tempfile.mkstemp(suffix='.wav')
-                os.close(fd)
+                if self._frames_dropped:
+                    log.warning(
+                        "Dropped %.1f s of audio while the writer was behind",
+                        self._frames_dropped / self.sample_rate
+                    )
                 
-                if self.chunk_files:
-                    # Combine all chunks into a single file
-                    combined_data = None
+                if self.frames_written > 0:
+                    # Check if audio is long enough (at least 0.5 seconds)
+                    min_duration_samples = int(0.5 * self.sample_rate)
+                    if self.frames_written < min_duration_samples:
+                        # Pad with silence if needed, reusing the idle ring buffer instead of a new array
+                        silence_pad = self._ring[:min_duration_samples - self.frames_written]
+                        silence_pad.fill(0)
+                        self._wav_file.write(silence_pad)
                     
-                    for chunk_file in self.chunk_files:
-                        data, _ = sf.read(chunk_file)
-                        if combined_data is None:
-                            combined_data = data
-                        else:
-                            combined_data = np.concatenate((combined_data, data))
-                    
-                    # Save as WAV file
-                    if combined_data is not None and len(combined_data) > 0:
-                        # Check if audio is long enough (at least 0.5 seconds)
-                        min_duration_samples = int(0.5 * self.sample_rate)
-                        if len(combined_data) < min_duration_samples:
-                            # Pad with silence if needed
-                            silence_pad = np.zeros((min_duration_samples - len(combined_data), self.channels))
-                            combined_data = np.concatenate((combined_data, silence_pad))
-                            
-                        sf.write(temp_path, combined_data, self.sample_rate)
-                        self.temp_file_path = temp_path
-                        self.finished.emit()
-                    else:
-                        self.error.emit("No audio recorded or recording too short")
-                        
-                    # Clean up chunk files
-                    for chunk_file in self.chunk_files:
-                        try:
-                            os.remove(chunk_file)
-                        except:
-                            pass
-                    try:
-                        os.rmdir(self.temp_dir)
-                    except:
-                        pass
+                    self._wav_file.close()
+                    self.temp_file_path = self._wav_path
+                    self.finished.emit()
                 else:
+                    self._discard_output_file()
                     self.error.emit("No audio recorded")
             except Exception as e:
                 self.error.emit(f"Error saving recording: {str(e)}")
+            finally:
+                # Re-enable the collector and clear whatever built up during the recording
+                if self._gc_was_enabled:
+                    gc.enable()
+                    gc.collect()
+                    self._gc_was_enabled = False
     
-    def _save_current_chunk(self):
-        """Save the current chunk to a temporary file."""
-        if not self.current_chunk:
-            return
-            
-        try:
-            # Create a temporary file for this chunk
-            chunk_file = os.path.join(self.temp_dir, f"chunk_{len(self.chunk_files)}.wav")
-            
-            # Combine all frames in the current chunk
-            chunk_data = np.concatenate(self.current_chunk, axis=0)
-            
-            # Save as WAV file
-            sf.write(chunk_file, chunk_data, self.sample_rate)
-            
-            # Add to chunk files list
-            self.chunk_files.append(chunk_file)
-            
-            # Clear the current chunk
-            self.current_chunk = []
-        except Exception as e:
-            print(f"Error saving chunk: {e}")
+    def _flush_ring(self):
+        """Queue the ring buffer slice captured since the last flush for the writer thread."""
+        if self._ring_write > self._ring_flushed:
+            self._audio_queue.put((
+                self._ring[self._ring_flushed:self._ring_write],
+                self._ring_pass_start + self._ring_write
+            ))
+            self._ring_flushed = self._ring_write
+    
+    def _write_queued_audio(self):
+        """Write captured audio blocks to the output file until the stop sentinel arrives."""
+        while True:
+            item = self._audio_queue.get()
+            if item is None:
+                break
+            block, ring_end = item
+            self._wav_file.write(block)
+            self.frames_written += len(block)
+            
+            # The ring slots up to here can be reused by the audio callback
+            self._ring_drained = ring_end
+    
+    def _stop_writer(self):
+        """Send the stop sentinel to the writer thread and wait for it to drain the queue."""
+        if self._writer_thread is not None:
+            self._audio_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+    
+    def _discard_output_file(self):
+        """Close and delete the output file after a failed or empty recording."""
+        self._stop_writer()
+        if self._wav_file is not None:
+            try:
+                self._wav_file.close()
+            except:
+                pass
+        if self._wav_path:
+            try:
+                os.remove(self._wav_path)
+            except:
+                pass
 
 
 class TranscriptionThread(QObject):
     """Thread for handling audio transcription to avoid UI freezing."""
     finished = Signal(str)
+    no_speech = Signal()
     error = Signal(str)
     progress = Signal(str)
     
-    def __init__(self, audio_file_path):
+    def __init__(self, audio_file_path, client, use_cache=True):
         super().__init__()
         self.audio_file_path = audio_file_path
+        self.client = client
+        self.use_cache = use_cache
         self.temp_dir = tempfile.mkdtemp()
         
     def transcribe(self):
         """Transcribe the audio file using OpenAI's Whisper API."""
         try:
             # Check if API key is set
-            if not openai.api_key:
+            if not self.client.api_key:
                 self.error.emit("OpenAI API key is not set. Please set it in Settings > Set OpenAI API Key.")
                 return
                 
@@ -279,24 +603,41 @@ class TranscriptionThread(QObject):
                 self.error.emit(f"Audio file not found: {self.audio_file_path}")
                 return
                 
+            # Don't pay for an API round trip on a recording of silence, and
+            # only upload the part of the recording that contains speech
+            speech_bounds = self._find_speech_bounds()
+            if speech_bounds is None:
+                self.no_speech.emit()
+                self._cleanup_temp_files()
+                return
+                
+            # Reuse the stored transcription if this exact audio was transcribed before
+            audio_hash = self._hash_audio_file() if self.use_cache else None
+            cached_text = self._cache_lookup(audio_hash) if self.use_cache else None
+            if cached_text is not None:
+                self.progress.emit("Using cached transcription...")
+                self.finished.emit(cached_text)
+                self._cleanup_temp_files()
+                return
+                
             # Get file size
             file_size = os.path.getsize(self.audio_file_path) / (1024 * 1024)  # Size in MB
             
             # If file is larger than 23MB (leaving buffer), use chunking approach
             if file_size > 23:
                 self.progress.emit(f"Large audio file detected ({file_size:.1f} MB). Processing in chunks...")
-                text = self._transcribe_large_file()
+                text = self._transcribe_large_file(speech_bounds)
             else:
                 self.progress.emit("Transcribing audio...")
                 
                 # Compress audio to reduce file size if needed
-                compressed_path = self._compress_audio(self.audio_file_path)
+                compressed_path = self._compress_audio(self.audio_file_path, speech_bounds=speech_bounds)
                 
                 # Open the audio file
                 with open(compressed_path, "rb") as audio_file:
                     # Call Whisper API
-                    response = openai.audio.transcriptions.create(
-                        model="whisper-1",
+                    response = self.client.audio.transcriptions.create(
+                        model=WHISPER_MODEL,
                         file=audio_file
                     )
                 
@@ -304,12 +645,15 @@ class TranscriptionThread(QObject):
                 text = response.text
                 
                 # Clean up temporary compressed file if it's different from original
-                if compressed_path != self.audio_file_path and os.path.exists(compressed_path):
+                if compressed_path != self.audio_file_path:
                     try:
                         os.remove(compressed_path)
                     except:
                         pass
             
+            if text and self.use_cache:
+                self._cache_store(audio_hash, text)
+            
             # Return the transcribed text
             self.finished.emit(text)
             
@@ -320,46 +664,119 @@ class TranscriptionThread(QObject):
             self.error.emit(f"Error during transcription: {str(e)}")
             self._cleanup_temp_files()
     
-    def _compress_audio(self, audio_path, target_size_mb=15):
-        """Compress audio file to reduce size while maintaining quality."""
+    def _find_speech_bounds(self):
+        """Find the span of the recording that contains speech.
+        
+        Returns (start, stop) sample positions padded by SPEECH_PADDING_SECONDS, (0, None)
+        for the whole file if it can't be analysed or no span stands out, or None if the
+        recording is digital silence. Quiet recordings are still uploaded.
+        """
+        import numpy as np
+        import soundfile as sf
+        
+        try:
+            sample_rate = sf.info(self.audio_file_path).samplerate
+            frame_size = int(sample_rate * SPEECH_FRAME_SECONDS)
+            frame_rms = []
+            position = 0
+            
+            for block in sf.blocks(self.audio_file_path, blocksize=frame_size * 100, dtype='int16', always_2d=True):
+                usable = len(block) // frame_size * frame_size
+                if usable:
+                    # One row per frame (all channels together), then the RMS of each row
+                    frames = block[:usable].astype(np.float32).reshape(-1, frame_size * block.shape[1])
+                    frame_rms.append(np.sqrt(np.mean(frames * frames, axis=1)))
+                position += len(block)
+            
+            # Fail open: only skip the upload when nothing rises above digital silence
+            rms = np.concatenate(frame_rms) if frame_rms else np.zeros(0, dtype=np.float32)
+            if not len(rms) or rms.max() < SILENCE_RMS_FLOOR:
+                return None
+            
+            # Set the threshold from this recording's own levels so quiet speakers aren't cut
+            noise_floor = np.percentile(rms, 10)
+            threshold = max(SILENCE_RMS_FLOOR, min(noise_floor * TRIM_NOISE_RATIO, rms.max() * TRIM_PEAK_RATIO))
+            voiced = np.flatnonzero(rms > threshold)
+            if not len(voiced):
+                return 0, None
+            
+            # A stop of None means the speech runs to the end of the file
+            padding = int(sample_rate * SPEECH_PADDING_SECONDS)
+            start = max(0, int(voiced[0]) * frame_size - padding)
+            stop = (int(voiced[-1]) + 1) * frame_size + padding
+            return start, (stop if stop < position else None)
+        except Exception as e:
+            # If the file can't be analysed, let Whisper decide
+            log.warning("Error checking for speech: %s", e)
+            return 0, None
+    
+    def _hash_audio_file(self):
+        """Hash the audio file contents together with the Whisper model name."""
+        digest = hashlib.blake2b(WHISPER_MODEL.encode(), digest_size=16)
+        with open(self.audio_file_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _open_cache(self):
+        """Open the transcription cache database, creating the table if needed."""
+        # Create the file owner-only before SQLite does, since it holds transcript text
+        os.close(os.open(TRANSCRIPTION_CACHE_FILE, os.O_RDONLY | os.O_CREAT, 0o600))
+        conn = sqlite3.connect(TRANSCRIPTION_CACHE_FILE)
+        conn.execute("CREATE TABLE IF NOT EXISTS transcriptions (hash TEXT PRIMARY KEY, text TEXT, used_at REAL)")
+        return conn
+    
+    def _cache_lookup(self, audio_hash):
+        """Return the cached transcription for the hash, or None on a miss."""
+        try:
+            with closing(self._open_cache()) as conn, conn:
+                row = conn.execute("SELECT text FROM transcriptions WHERE hash = ?", (audio_hash,)).fetchone()
+                if row is not None:
+                    # Touch the entry so eviction drops the least recently used ones first
+                    conn.execute("UPDATE transcriptions SET used_at = ? WHERE hash = ?", (time.time(), audio_hash))
+                    return row[0]
+        except sqlite3.Error as e:
+            log.warning("Error reading transcription cache: %s", e)
+        return None
+    
+    def _cache_store(self, audio_hash, text):
+        """Store a transcription and evict the oldest entries beyond the cache size."""
+        try:
+            with closing(self._open_cache()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO transcriptions (hash, text, used_at) VALUES (?, ?, ?)",
+                    (audio_hash, text, time.time())
+                )
+                conn.execute(
+                    "DELETE FROM transcriptions WHERE hash NOT IN "
+                    "(SELECT hash FROM transcriptions ORDER BY used_at DESC LIMIT ?)",
+                    (TRANSCRIPTION_CACHE_SIZE,)
+                )
+        except sqlite3.Error as e:
+            log.warning("Error writing transcription cache: %s", e)
+    
+    def _compress_audio(self, audio_path, target_size_mb=15, speech_bounds=(0, None)):
+        """Compress audio file to reduce size while maintaining quality.
+        
+        speech_bounds is the (start, stop) sample range to keep; silence outside it is dropped.
+        """
         try:
             # Get file size
             file_size = os.path.getsize(audio_path) / (1024 * 1024)  # Size in MB
             
-            # If file is already small enough, return original path
-            if file_size <= target_size_mb:
-                return audio_path
-                
-            self.progress.emit(f"Compressing audio to optimize for API limits...")
-            
-            # Load audio file
-            data, sample_rate = sf.read(audio_path)
+            # Always re-encode: Opus is a fraction of the size of the recorded WAV,
+            # so even short recordings upload faster
+            self.progress.emit("Compressing audio for upload...")
             
-            # Create a temporary file for compressed audio
-            fd, compressed_path = tempfile.mkstemp(suffix='.mp3', dir=self.temp_dir)
-            os.close(fd)
-            
-            # Calculate target bitrate based on desired file size and duration
-            duration = len(data) / sample_rate
-            target_bitrate = int((target_size_mb * 8 * 1024) / duration)
-            
-            # Ensure bitrate is reasonable (between 32kbps and 128kbps)
-            target_bitrate = max(32, min(128, target_bitrate))
-            
-            # Use ffmpeg to compress the audio (requires ffmpeg to be installed)
-            import subprocess
-            cmd = [
-                'ffmpeg', '-y', '-i', audio_path, 
-                '-b:a', f'{target_bitrate}k', 
-                '-ac', '1',  # Convert to mono
-                compressed_path
-            ]
-            
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            
-            # Check if compression was successful
-            if os.path.exists(compressed_path) and os.path.getsize(compressed_path) > 0:
-                compressed_size = os.path.getsize(compressed_path) / (1024 * 1024)
+            try:
+                compressed_path = self._encode_opus(audio_path, speech_bounds)
+            except Exception:
+                # Fall back to ffmpeg if this libsndfile build cannot write Opus
+                compressed_path = self._encode_with_ffmpeg(audio_path, target_size_mb, speech_bounds)
+            
+            # Check if compression was successful (a missing file raises and falls through below)
+            compressed_size = os.path.getsize(compressed_path) / (1024 * 1024)
+            if compressed_size > 0:
                 self.progress.emit(f"Compressed audio from {file_size:.1f}MB to {compressed_size:.1f}MB")
                 return compressed_path
             else:
@@ -370,67 +787,100 @@ class TranscriptionThread(QObject):
             self.progress.emit(f"Audio compression failed: {str(e)}. Using original file.")
             return audio_path
     
-    def _transcribe_large_file(self):
+    def _encode_opus(self, audio_path, speech_bounds=(0, None)):
+        """Encode audio as 16 kHz mono Ogg/Opus in-process with soundfile."""
+        import numpy as np
+        import soundfile as sf
+        
+        start, stop = speech_bounds
+        data, sample_rate = sf.read(audio_path, start=start, stop=stop, dtype='int16', always_2d=True)
+        
+        # Whisper works on 16 kHz mono audio, so downmix and resample before encoding
+        if data.shape[1] == 1:
+            data = data[:, 0]
+        else:
+            data = data.mean(axis=1, dtype=np.float32).astype(np.int16)
+        if sample_rate != OPUS_SAMPLE_RATE:
+            data = data.astype(np.float32)
+            if sample_rate > OPUS_SAMPLE_RATE:
+                # Low-pass below the new Nyquist frequency first, otherwise energy above
+                # 8 kHz (fricatives) folds back into the speech band when decimating
+                cutoff = 0.45 * OPUS_SAMPLE_RATE / sample_rate  # cycles per input sample
+                n = np.arange(RESAMPLE_FILTER_TAPS) - (RESAMPLE_FILTER_TAPS - 1) / 2
+                taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(RESAMPLE_FILTER_TAPS)
+                data = np.convolve(data, (taps / taps.sum()).astype(np.float32), mode='same')
+            
+            if sample_rate % OPUS_SAMPLE_RATE == 0:
+                # Integer ratio (e.g. 48 kHz): keep every nth filtered sample
+                data = data[::sample_rate // OPUS_SAMPLE_RATE]
+            else:
+                num_samples = int(len(data) * OPUS_SAMPLE_RATE / sample_rate)
+                positions = np.arange(num_samples) * (sample_rate / OPUS_SAMPLE_RATE)
+                data = np.interp(positions, np.arange(len(data)), data)
+            data = np.clip(np.round(data), -32768, 32767).astype(np.int16)
+        
+        # Create a temporary file for compressed audio
+        fd, compressed_path = tempfile.mkstemp(suffix='.ogg', dir=self.temp_dir)
+        os.close(fd)
+        
+        sf.write(compressed_path, data, OPUS_SAMPLE_RATE, format='OGG', subtype='OPUS')
+        return compressed_path
+    
+    def _encode_with_ffmpeg(self, audio_path, target_size_mb, speech_bounds=(0, None)):
+        """Encode audio as MP3 with an ffmpeg subprocess (requires ffmpeg to be installed)."""
+        import soundfile as sf
+        
+        # Create a temporary file for compressed audio
+        fd, compressed_path = tempfile.mkstemp(suffix='.mp3', dir=self.temp_dir)
+        os.close(fd)
+        
+        # Calculate target bitrate based on desired file size and duration
+        info = sf.info(audio_path)
+        duration = info.duration
+        target_bitrate = int((target_size_mb * 8 * 1024) / duration)
+        
+        # Ensure bitrate is reasonable (between 32kbps and 128kbps)
+        target_bitrate = max(32, min(128, target_bitrate))
+        
+        import subprocess
+        cmd = [
+            'ffmpeg', '-y', '-i', audio_path, 
+            '-b:a', f'{target_bitrate}k', 
+            '-ac', '1',  # Convert to mono
+        ]
+        
+        # Keep only the part of the recording that contains speech
+        start, stop = speech_bounds
+        if start:
+            cmd += ['-ss', f'{start / info.samplerate:.3f}']
+        if stop is not None:
+            cmd += ['-to', f'{stop / info.samplerate:.3f}']
+        cmd.append(compressed_path)
+        
+        subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        return compressed_path
+    
+    def _transcribe_large_file(self, speech_bounds=(0, None)):
         """Handle transcription of large audio files by splitting into chunks."""
         try:
             self.progress.emit("Splitting large audio file into chunks...")
             
-            # Load audio file
-            data, sample_rate = sf.read(self.audio_file_path)
-            
-            # Calculate chunk size (in samples) for approximately 5-minute chunks
-            # This should result in files under 10MB each for typical audio quality
-            chunk_duration = 5 * 60  # 5 minutes in seconds
-            chunk_size = int(chunk_duration * sample_rate)
-            
-            # Calculate number of chunks
-            total_samples = len(data)
-            num_chunks = (total_samples + chunk_size - 1) // chunk_size  # Ceiling division
-            
-            # Create chunks and transcribe each one
-            all_transcriptions = []
-            
-            for i in range(num_chunks):
-                self.progress.emit(f"Processing chunk {i+1} of {num_chunks}...")
-                
-                # Extract chunk data
-                start_idx = i * chunk_size
-                end_idx = min(start_idx + chunk_size, total_samples)
-                chunk_data = data[start_idx:end_idx]
-                
-                # Create a temporary file for this chunk
-                fd, chunk_path = tempfile.mkstemp(suffix='.wav', dir=self.temp_dir)
-                os.close(fd)
-                
-                # Save chunk to file
-                sf.write(chunk_path, chunk_data, sample_rate)
-                
-                # Compress the chunk
-                compressed_chunk_path = self._compress_audio(chunk_path)
-                
-                # Transcribe the chunk
-                with open(compressed_chunk_path, "rb") as audio_file:
-                    self.progress.emit(f"Transcribing chunk {i+1}...")
-                    response = openai.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file
-                    )
-                
-                # Add to transcriptions
-                all_transcriptions.append(response.text)
-                
-                # Clean up chunk files
-                if os.path.exists(chunk_path):
-                    try:
-                        os.remove(chunk_path)
-                    except:
-                        pass
-                
-                if compressed_chunk_path != chunk_path and os.path.exists(compressed_chunk_path):
-                    try:
-                        os.remove(compressed_chunk_path)
-                    except:
-                        pass
+            # Each pool job reads, writes and compresses its own chunk, so the first
+            # upload can start while later chunks are still being prepared
+            chunk_ranges = self._chunk_ranges(speech_bounds)
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                chunk_futures = [
+                    pool.submit(self._prepare_chunk, chunk_start, chunk_frames, i, len(chunk_ranges))
+                    for i, (chunk_start, chunk_frames) in enumerate(chunk_ranges)
+                ]
+                try:
+                    all_transcriptions = asyncio.run(self._transcribe_chunks_async(chunk_futures))
+                except BaseException:
+                    # Drop the chunks that haven't started so the error is reported
+                    # without preparing the rest of the recording first
+                    for future in chunk_futures:
+                        future.cancel()
+                    raise
             
             # Combine all transcriptions
             combined_text = " ".join(all_transcriptions)
@@ -441,6 +891,87 @@ class TranscriptionThread(QObject):
             self.error.emit(f"Error processing large audio file: {str(e)}")
             return ""
     
+    def _chunk_ranges(self, speech_bounds=(0, None)):
+        """Return (start_frame, frames) for each chunk of the speech span."""
+        import soundfile as sf
+        
+        info = sf.info(self.audio_file_path)
+        
+        # Skip the silence before and after the speech
+        start, stop = speech_bounds
+        if stop is None:
+            stop = info.frames
+        
+        # Calculate chunk size (in samples) for approximately 5-minute chunks
+        # This should result in files under 10MB each for typical audio quality
+        chunk_duration = 5 * 60  # 5 minutes in seconds
+        chunk_size = int(chunk_duration * info.samplerate)
+        
+        return [
+            (chunk_start, min(chunk_size, stop - chunk_start))
+            for chunk_start in range(start, stop, chunk_size)
+        ]
+    
+    def _prepare_chunk(self, chunk_start, chunk_frames, index, num_chunks):
+        """Write one chunk of the source file to a WAV and compress it, returning the path to upload."""
+        import soundfile as sf
+        
+        self.progress.emit(f"Processing chunk {index+1} of {num_chunks}...")
+        
+        # Only this chunk of 16-bit PCM is held in memory
+        with sf.SoundFile(self.audio_file_path) as source:
+            source.seek(chunk_start)
+            chunk_data = source.read(chunk_frames, dtype='int16')
+            sample_rate = source.samplerate
+        
+        # Create a temporary file for this chunk
+        fd, chunk_path = tempfile.mkstemp(suffix='.wav', dir=self.temp_dir)
+        os.close(fd)
+        
+        # Save chunk to file
+        sf.write(chunk_path, chunk_data, sample_rate, subtype='PCM_16')
+        
+        compressed_chunk_path = self._compress_audio(chunk_path)
+        if compressed_chunk_path != chunk_path:
+            try:
+                os.remove(chunk_path)
+            except:
+                pass
+        return compressed_chunk_path
+    
+    async def _transcribe_chunks_async(self, chunk_futures):
+        """Transcribe chunks concurrently as they become ready, returning the texts in chunk order."""
+        import openai
+        
+        client = openai.AsyncOpenAI(api_key=self.client.api_key)
+        semaphore = asyncio.Semaphore(min(MAX_CONCURRENT_UPLOADS, len(chunk_futures)))
+        try:
+            return await asyncio.gather(*(
+                self._transcribe_chunk(client, semaphore, i, future, len(chunk_futures))
+                for i, future in enumerate(chunk_futures)
+            ))
+        finally:
+            await client.close()
+    
+    async def _transcribe_chunk(self, client, semaphore, index, chunk_future, num_chunks):
+        """Wait for a chunk to be prepared, then transcribe it once a concurrency slot is free."""
+        chunk_path = await asyncio.wrap_future(chunk_future)
+        async with semaphore:
+            self.progress.emit(f"Transcribing chunk {index+1} of {num_chunks}...")
+            with open(chunk_path, "rb") as audio_file:
+                response = await client.audio.transcriptions.create(
+                    model=WHISPER_MODEL,
+                    file=audio_file
+                )
+        
+        # Clean up chunk file
+        try:
+            os.remove(chunk_path)
+        except:
+            pass
+        
+        return response.text
+    
     def _cleanup_temp_files(self):
         """Clean up temporary files and directory."""
         try:
@@ -449,24 +980,28 @@ class TranscriptionThread(QObject):
             if os.path.exists(self.temp_dir):
                 shutil.rmtree(self.temp_dir, ignore_errors=True)
         except Exception as e:
-            print(f"Error cleaning up temporary files: {e}")
+            log.warning("Error cleaning up temporary files: %s", e)
 
 
 class CleanupThread(QObject):
     """Thread for handling text cleanup with GPT to avoid UI freezing."""
     finished = Signal(str)
+    chunk_ready = Signal(str)
+    styles_ready = Signal(dict)
     error = Signal(str)
     
-    def __init__(self, text, transformation_style="Standard"):
+    def __init__(self, text, client, transformation_style="Standard", styles=None):
         super().__init__()
         self.text = text
+        self.client = client
         self.transformation_style = transformation_style
+        self.styles = styles
         
     def cleanup(self):
         """Clean up the transcription using OpenAI's GPT API."""
         try:
             # Check if API key is set
-            if not openai.api_key:
+            if not self.client.api_key:
                 self.error.emit("OpenAI API key is not set. Please set it in Settings > Set OpenAI API Key.")
                 return
                 
@@ -475,26 +1010,83 @@ class CleanupThread(QObject):
                 self.error.emit("No text to clean up.")
                 return
             
+            # Several styles are requested together in a single structured response
+            transformations = get_text_transformations()
+            if "Standard" not in transformations:
+                self.error.emit("Text transformation prompts are unavailable. Check system-prompts/text-transformations.json.")
+                return
+            if self.styles:
+                self._cleanup_multiple_styles(transformations)
+                return
+            
             # Get the appropriate system prompt based on transformation style
-            system_prompt = TEXT_TRANSFORMATIONS.get(self.transformation_style, TEXT_TRANSFORMATIONS["Standard"])
+            system_prompt = transformations.get(self.transformation_style, transformations["Standard"])
             
-            response = openai.chat.completions.create(
+            # Stream the response so the text appears as it is generated
+            stream = self.client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": self.text}
-                ]
+                ],
+                stream=True
             )
             
+            chunks = []
+            for event in stream:
+                if not event.choices:
+                    continue
+                delta = event.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    self.chunk_ready.emit(delta)
+            
             # Check if response has content
-            if not response or not response.choices or not response.choices[0].message.content:
+            if not chunks:
                 self.error.emit("Received empty response from OpenAI API.")
                 return
                 
-            cleaned_text = response.choices[0].message.content
+            cleaned_text = "".join(chunks)
             self.finished.emit(cleaned_text)
         except Exception as e:
             self.error.emit(f"Error during GPT cleanup: {str(e)}")
+    
+    def _cleanup_multiple_styles(self, transformations):
+        """Apply every requested style in one API call and emit a {style: text} dict."""
+        system_prompt = (
+            "Apply each of the following text transformations independently to the text submitted by the user. "
+            "Return a JSON object with one key per transformation name whose value is the transformed text.\n\n"
+        )
+        for style in self.styles:
+            system_prompt += f"## {style}\n{transformations.get(style, transformations['Standard'])}\n\n"
+        
+        response = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": self.text}
+            ],
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "styles",
+                    "strict": True,
+                    "schema": {
+                        "type": "object",
+                        "properties": {style: {"type": "string"} for style in self.styles},
+                        "required": list(self.styles),
+                        "additionalProperties": False
+                    }
+                }
+            }
+        )
+        
+        # Check if response has content
+        if not response or not response.choices or not response.choices[0].message.content:
+            self.error.emit("Received empty response from OpenAI API.")
+            return
+            
+        self.styles_ready.emit(json.loads(response.choices[0].message.content))
 
 
 class SystemPromptSelector(QWidget):
@@ -603,15 +1195,13 @@ class SystemPromptSelector(QWidget):
                 "updated-system-prompts.json"
             )
             
-            # Check if file exists
-            if not os.path.exists(updated_prompts_file):
+            # Load prompts from file in a single read
+            try:
+                prompts = _json_loads(Path(updated_prompts_file).read_bytes())
+            except FileNotFoundError:
                 QMessageBox.warning(self, "Error", f"System prompts file not found: {updated_prompts_file}")
                 return
                 
-            # Load prompts from file
-            with open(updated_prompts_file, "r") as f:
-                prompts = json.load(f)
-                
             # Process prompts and organize by category
             categories = {}
             self.all_prompts = []
@@ -788,32 +1378,83 @@ class SystemPromptSelector(QWidget):
 class WhisperNotepadApp(QMainWindow):
     """Main application window for Whisper Notepad Simple."""
     
+    # Parsed configuration, shared by every window so the file is only read once per process
+    _config_cache = None
+    
+    # Config file contents as last read or written, so unchanged configs aren't rewritten
+    _config_on_disk = None
+    
+    # Set when the config file exists but could not be parsed, so it is backed up before a save
+    _config_unreadable = False
+    
     def __init__(self):
         super().__init__()
         self.recording_thread = None
         self.transcription_thread = None
         self.cleanup_thread = None
         self.temp_audio_file = None
+        self._cached_devices = None
+        self._device_index_by_id = {}
         self.recording_timer = None
         self.recording_time = 0
+        self._minute_prefix = "00:"
         self.is_recording = False
         self.is_paused = False
+        self._auto_transcribe_after_stop = False
+        self._config_save_thread = None
         
         # Load configuration
         self.load_config()
         
-        # Set OpenAI API key if available
-        if "api_key" in self.config and self.config["api_key"]:
-            openai.api_key = self.config["api_key"]
-            
-        # Configure SSL verification (always disable for now to fix the issue)
-        openai.requestssession = self._get_unverified_session()
+        # One pooled API client shared by all requests, created on first use
+        self._openai_client = None
+        self._openai_client_lock = threading.Lock()
             
         # Initialize UI
         self.init_ui()
         
-        # Load audio devices
-        self.load_audio_devices()
+        # Load audio devices once the window is up
+        QTimer.singleShot(0, self.load_audio_devices)
+        
+        # Import openai and open the API connection in the background so the
+        # first request skips the import and DNS/TLS setup
+        if self._resolve_api_key():
+            QThreadPool.globalInstance().start(self._warm_up_connection)
+    
+    @property
+    def openai_client(self):
+        """The shared OpenAI client, created when it is first needed."""
+        with self._openai_client_lock:
+            if self._openai_client is None:
+                self._openai_client = self._create_openai_client()
+            return self._openai_client
+    
+    def _resolve_api_key(self):
+        """Return the configured API key, falling back to the OPENAI_API_KEY environment variable."""
+        return self.config.api_key or os.environ.get("OPENAI_API_KEY", "")
+    
+    def _create_openai_client(self):
+        """Create the OpenAI client shared by every transcription and cleanup request."""
+        import httpx
+        import openai
+        
+        # Configure SSL verification (always disable for now to fix the issue)
+        openai.requestssession = self._get_unverified_session()
+        
+        http_client = httpx.Client(
+            # HTTP/2 multiplexing needs the optional h2 package
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=httpx.Timeout(600.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+        )
+        return openai.OpenAI(api_key=self._resolve_api_key(), http_client=http_client)
+    
+    def _warm_up_connection(self):
+        """Make a lightweight API request so a keep-alive connection is ready for later calls."""
+        try:
+            self.openai_client.models.list()
+        except Exception:
+            pass
     
     def _get_unverified_session(self):
         """Create a requests session that doesn't verify SSL certificates."""
@@ -830,6 +1471,10 @@ class WhisperNotepadApp(QMainWindow):
         # Set application style
         self.setup_style()
         
+        # Icons shared by several buttons, looked up from the style once
+        self._icon_save = self.style().standardIcon(QStyle.SP_DialogSaveButton)
+        self._icon_open = self.style().standardIcon(QStyle.SP_DialogOpenButton)
+        
         # Create central widget and main layout
         central_widget = QWidget()
         main_layout = QVBoxLayout(central_widget)
@@ -918,7 +1563,7 @@ class WhisperNotepadApp(QMainWindow):
         # Clear recording button
         self.clear_recording_button = QPushButton()
         self.clear_recording_button.setIcon(self.style().standardIcon(QStyle.SP_DialogDiscardButton))
-        self.clear_recording_button.setToolTip("Clear Recording (Ctrl+Shift+C)")
+        self.clear_recording_button.setToolTip("Clear Recording (Ctrl+Shift+X)")
         self.clear_recording_button.clicked.connect(self.clear_recording)
         self.clear_recording_button.setEnabled(False)
         self.clear_recording_button.setMinimumSize(40, 40)
@@ -946,13 +1591,25 @@ class WhisperNotepadApp(QMainWindow):
         transformation_layout = QHBoxLayout()
         transformation_label = QLabel("Transformation Style:")
         self.transformation_combo = QComboBox()
-        for style in TEXT_TRANSFORMATIONS.keys():
-            self.transformation_combo.addItem(style)
+        # Fill the combo from a prebuilt model rather than one insert per style
+        transformations = get_text_transformations()
+        if not transformations:
+            self.show_error(
+                "Could not load text transformation styles from system-prompts/text-transformations.json. "
+                "Transcription still works, but GPT cleanup is unavailable."
+            )
+        self.transformation_combo.setModel(
+            QStringListModel(list(transformations), self.transformation_combo)
+        )
         
         # Set default transformation style from config
-        default_style = self.config.get("default_transformation", "Standard")
-        if default_style in TEXT_TRANSFORMATIONS:
+        default_style = self.config.default_transformation
+        if default_style in transformations:
             self.transformation_combo.setCurrentText(default_style)
+        
+        # Track the selected style as it changes instead of querying the combo on each use
+        self._current_style = self.transformation_combo.currentText()
+        self.transformation_combo.currentTextChanged.connect(self._set_current_style)
             
         self.transformation_combo.setToolTip("Select the style of text transformation to apply")
         self.transformation_combo.setEnabled(True)
@@ -1010,29 +1667,24 @@ class WhisperNotepadApp(QMainWindow):
         # Add copy button for raw text
         raw_top_layout = QHBoxLayout()
         self.raw_copy_button = QPushButton("Copy")
-        self.raw_copy_button.setIcon(self.style().standardIcon(QStyle.SP_DialogSaveButton))
+        self.raw_copy_button.setIcon(self._icon_save)
         self.raw_copy_button.setToolTip("Copy to Clipboard (Ctrl+Shift+R)")
-        self.raw_copy_button.clicked.connect(lambda: self.copy_text_to_clipboard(self.raw_text))
+        self.raw_copy_button.clicked.connect(self._copy_raw)
         raw_top_layout.addStretch()
         raw_top_layout.addWidget(self.raw_copy_button)
         raw_layout.addLayout(raw_top_layout)
         
-        self.raw_text = QTextEdit()
+        # Plain-text widget: the raw transcript never needs rich-text layout
+        self.raw_text = QPlainTextEdit()
+        self.raw_text.setObjectName("rawText")
         self.raw_text.setReadOnly(True)
-        self.raw_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f8f8;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-        """)
         
         # Set raw text to be lighter and smaller
         raw_font = self.raw_text.font()
         raw_font.setPointSize(raw_font.pointSize() - 1)
         self.raw_text.setFont(raw_font)
+        # A block limit also turns off undo history, which programmatic loads don't need
+        self.raw_text.setMaximumBlockCount(RAW_TEXT_MAX_BLOCKS)
         raw_layout.addWidget(self.raw_text)
         
         middle_section.addWidget(raw_group)
@@ -1045,17 +1697,17 @@ class WhisperNotepadApp(QMainWindow):
         clean_top_layout = QHBoxLayout()
         
         self.clean_copy_button = QPushButton("Copy")
-        self.clean_copy_button.setIcon(self.style().standardIcon(QStyle.SP_DialogSaveButton))
+        self.clean_copy_button.setIcon(self._icon_save)
         self.clean_copy_button.setToolTip("Copy to Clipboard (Ctrl+Shift+C)")
-        self.clean_copy_button.clicked.connect(lambda: self.copy_text_to_clipboard(self.cleaned_text))
+        self.clean_copy_button.clicked.connect(self._copy_clean)
         
         self.save_button = QPushButton("Save")
-        self.save_button.setIcon(self.style().standardIcon(QStyle.SP_DialogSaveButton))
+        self.save_button.setIcon(self._icon_save)
         self.save_button.setToolTip("Save to File (Ctrl+S)")
         self.save_button.clicked.connect(self.save_note)
         
         self.load_button = QPushButton("Load")
-        self.load_button.setIcon(self.style().standardIcon(QStyle.SP_DialogOpenButton))
+        self.load_button.setIcon(self._icon_open)
         self.load_button.setToolTip("Load from File (Ctrl+O)")
         self.load_button.clicked.connect(self.load_note)
         
@@ -1065,16 +1717,9 @@ class WhisperNotepadApp(QMainWindow):
         clean_top_layout.addWidget(self.load_button)
         clean_layout.addLayout(clean_top_layout)
         
-        self.cleaned_text = QTextEdit()
-        self.cleaned_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #ffffff;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                padding: 8px;
-                font-family: 'Segoe UI', Arial, sans-serif;
-            }
-        """)
+        # QPlainTextEdit only lays out the paragraphs in view, which keeps long notes responsive
+        self.cleaned_text = QPlainTextEdit()
+        self.cleaned_text.setObjectName("cleanText")
         clean_layout.addWidget(self.cleaned_text)
         
         middle_section.addWidget(clean_group)
@@ -1096,108 +1741,47 @@ class WhisperNotepadApp(QMainWindow):
         # Setup keyboard shortcuts
         self.setup_shortcuts()
         
-        # Setup recording timer
-        self.recording_timer = QTimer()
+        # Setup recording timer (created once and reused for every recording session)
+        self.recording_timer = QTimer(self)
+        self.recording_timer.setTimerType(Qt.PreciseTimer)
         self.recording_timer.timeout.connect(self.update_recording_time)
         
+        # Timer that feeds long transcripts into the raw pane a slice at a time
+        self._raw_text_slices = []
+        self.raw_text_timer = QTimer(self)
+        self.raw_text_timer.timeout.connect(self.append_raw_text_slice)
+        
     def setup_style(self):
         """Set up the application style."""
         # Set application-wide stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                padding-top: 10px;
-                background-color: #ffffff;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center;
-                padding: 0 5px;
-                background-color: #ffffff;
-            }
-            QPushButton {
-                background-color: #f0f0f0;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 5px 10px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-                border: 1px solid #bbbbbb;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QPushButton:disabled {
-                background-color: #f8f8f8;
-                color: #aaaaaa;
-                border: 1px solid #dddddd;
-            }
-            QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 1px 18px 1px 3px;
-                min-width: 6em;
-                background-color: #ffffff;
-            }
-            QComboBox:hover {
-                border: 1px solid #bbbbbb;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 15px;
-                border-left-width: 1px;
-                border-left-color: #cccccc;
-                border-left-style: solid;
-                border-top-right-radius: 3px;
-                border-bottom-right-radius: 3px;
-            }
-            QSplitter::handle {
-                background-color: #cccccc;
-            }
-            QSplitter::handle:horizontal {
-                width: 4px;
-            }
-            QSplitter::handle:vertical {
-                height: 4px;
-            }
-            QCheckBox {
-                spacing: 5px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-        """)
+        self.setStyleSheet(_APP_STYLESHEET)
         
     def setup_shortcuts(self):
         """Set up keyboard shortcuts for the application."""
-        # File menu shortcuts
-        QShortcut(QKeySequence("Ctrl+N"), self, self.new_note)
-        QShortcut(QKeySequence("Ctrl+O"), self, self.load_note)
-        QShortcut(QKeySequence("Ctrl+S"), self, self.save_note)
-        QShortcut(QKeySequence("Ctrl+Q"), self, self.close)
+        # File shortcuts (Ctrl+N/O/S/Q) are set on their menu actions in create_menu_bar
         
         # Recording shortcuts
         QShortcut(QKeySequence("F5"), self, self.start_recording)
         QShortcut(QKeySequence("F6"), self, self.pause_recording)
         QShortcut(QKeySequence("F7"), self, self.stop_recording)
         QShortcut(QKeySequence("F8"), self, self.stop_and_transcribe)
-        QShortcut(QKeySequence("Ctrl+Shift+C"), self, self.clear_recording)
+        QShortcut(QKeySequence("Ctrl+Shift+X"), self, self.clear_recording)
         
         # Transcription shortcuts
         QShortcut(QKeySequence("Ctrl+T"), self, self.transcribe_audio)
         
-        # Copy shortcuts
-        QShortcut(QKeySequence("Ctrl+Shift+R"), self, lambda: self.copy_text_to_clipboard(self.raw_text))
-        QShortcut(QKeySequence("Ctrl+Shift+C"), self, lambda: self.copy_text_to_clipboard(self.cleaned_text))
+        # Copy shortcuts, as window-wide actions connected to bound methods
+        self._copy_raw_action = QAction(self)
+        self._copy_raw_action.setShortcut("Ctrl+Shift+R")
+        self._copy_raw_action.setShortcutContext(Qt.WindowShortcut)
+        self._copy_raw_action.triggered.connect(self._copy_raw)
+        self.addAction(self._copy_raw_action)
+        
+        self._copy_clean_action = QAction(self)
+        self._copy_clean_action.setShortcut("Ctrl+Shift+C")
+        self._copy_clean_action.setShortcutContext(Qt.WindowShortcut)
+        self._copy_clean_action.triggered.connect(self._copy_clean)
+        self.addAction(self._copy_clean_action)
         
         # Device shortcut
         QShortcut(QKeySequence("Ctrl+D"), self, self.save_default_device)
@@ -1236,6 +1820,13 @@ class WhisperNotepadApp(QMainWindow):
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
+        # Process menu
+        process_menu = menu_bar.addMenu("Process")
+        
+        multi_style_action = QAction("Apply Multiple Styles...", self)
+        multi_style_action.triggered.connect(self.apply_multiple_styles)
+        process_menu.addAction(multi_style_action)
+        
         # Settings menu
         settings_menu = menu_bar.addMenu("Settings")
         
@@ -1247,6 +1838,14 @@ class WhisperNotepadApp(QMainWindow):
         settings_action.triggered.connect(self.show_settings)
         settings_menu.addAction(settings_action)
         
+        rescan_action = QAction("Rescan Audio Devices", self)
+        rescan_action.triggered.connect(self.rescan_audio_devices)
+        settings_menu.addAction(rescan_action)
+        
+        clear_cache_action = QAction("Clear Transcription Cache", self)
+        clear_cache_action.triggered.connect(self.clear_transcription_cache)
+        settings_menu.addAction(clear_cache_action)
+        
         # Help menu
         help_menu = menu_bar.addMenu("Help")
         
@@ -1254,41 +1853,57 @@ class WhisperNotepadApp(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
         
+    def _set_current_style(self, style):
+        """Remember the transformation style selected in the combo box."""
+        self._current_style = style
+        
     def load_audio_devices(self):
         """Load available audio input devices."""
+        import sounddevice as sd
+        
         try:
-            devices = sd.query_devices()
-            input_devices = []
-            
-            for i, device in enumerate(devices):
-                if device['max_input_channels'] > 0:
-                    # Add device info including default sample rate
-                    name = device['name']
-                    if 'default_samplerate' in device:
-                        sample_rate = int(device['default_samplerate'])
-                        name += f" ({sample_rate} Hz)"
-                    input_devices.append((i, name))
+            # Enumerating devices is slow, so the list is kept until a rescan
+            if self._cached_devices is None:
+                input_devices = []
+                
+                for i, device in enumerate(sd.query_devices()):
+                    if device['max_input_channels'] > 0:
+                        # Add device info including default sample rate
+                        name = device['name']
+                        if 'default_samplerate' in device:
+                            sample_rate = int(device['default_samplerate'])
+                            name += f" ({sample_rate} Hz)"
+                        input_devices.append((i, name))
+                
+                self._cached_devices = input_devices
             
+            # Populate silently; only the final selection below should signal a change
+            self.device_combo.blockSignals(True)
             self.device_combo.clear()
-            for idx, name in input_devices:
+            self._device_index_by_id = {}
+            for row, (idx, name) in enumerate(self._cached_devices):
                 self.device_combo.addItem(name, idx)
+                self._device_index_by_id[idx] = row
+            self.device_combo.blockSignals(False)
             
             # Set the default device from config if available
-            default_device_id = self.config.get("default_device_id")
-            default_device_name = self.config.get("default_device")
-            
-            # First try to set by device ID (more reliable)
-            if default_device_id is not None:
-                for i in range(self.device_combo.count()):
-                    if self.device_combo.itemData(i) == default_device_id:
-                        self.device_combo.setCurrentIndex(i)
-                        break
-            # If that fails, try by name
+            default_device_id = self.config.default_device_id
+            default_device_name = self.config.default_device
+            
+            # First try to set by device ID, as long as that ID still belongs to the saved
+            # device (PortAudio renumbers devices when they are added or removed)
+            row = self._device_index_by_id.get(default_device_id)
+            if row is not None and (
+                default_device_name is None or default_device_name in self.device_combo.itemText(row)
+            ):
+                self.device_combo.setCurrentIndex(row)
+            # If that fails, try by name and remember the device's new ID
             elif default_device_name is not None:
                 # Try to find by partial match since we added sample rate info
                 for i in range(self.device_combo.count()):
                     if default_device_name in self.device_combo.itemText(i):
                         self.device_combo.setCurrentIndex(i)
+                        self.config.default_device_id = self.device_combo.itemData(i)
                         break
             
             # If we have devices but none selected, select the first one
@@ -1297,23 +1912,45 @@ class WhisperNotepadApp(QMainWindow):
                 
             # Show a warning if no input devices are found
             if self.device_combo.count() == 0:
-                self.show_error("No audio input devices found. Please connect a microphone and restart the application.")
+                self.show_error("No audio input devices found. Please connect a microphone and use Settings > Rescan Audio Devices.")
         except Exception as e:
             self.show_error(f"Error loading audio devices: {str(e)}")
     
+    def rescan_audio_devices(self):
+        """Drop the cached device list and enumerate the audio devices again."""
+        try:
+            import sounddevice as sd
+            
+            # PortAudio only sees newly connected devices after it is reinitialized.
+            # That renumbers the devices, so sample rates cached by index are stale too.
+            if self.recording_thread is None:
+                sd._terminate()
+                sd._initialize()
+                RecordingThread.sample_rate_cache.clear()
+        except Exception as e:
+            self.show_error(f"Error rescanning audio devices: {str(e)}")
+            return
+        
+        self._cached_devices = None
+        self.load_audio_devices()
+        self.statusBar().showMessage("Audio devices rescanned")
+    
     def save_default_device(self):
         """Save the currently selected device as the default."""
         if self.device_combo.currentIndex() >= 0:
             device_idx = self.device_combo.currentData()
-            device_text = self.device_combo.currentText()
-            # Extract just the device name without the sample rate
-            device_name = device_text.split(" (")[0] if " (" in device_text else device_text
+            device_name = self._selected_device_name()
             
-            self.config["default_device"] = device_name
-            self.config["default_device_id"] = device_idx
+            self.config.default_device = device_name
+            self.config.default_device_id = device_idx
             self.save_config()
             self.statusBar().showMessage(f"Device '{device_name}' set as default", 3000)
     
+    def _selected_device_name(self):
+        """Return the selected device's name without the sample rate suffix."""
+        device_text = self.device_combo.currentText()
+        return device_text.split(" (")[0] if " (" in device_text else device_text
+    
     def clear_recording(self):
         """Clear the current recording."""
         self.temp_audio_file = None
@@ -1324,9 +1961,12 @@ class WhisperNotepadApp(QMainWindow):
     def update_recording_time(self):
         """Update the recording time display."""
         self.recording_time += 1
-        minutes = self.recording_time // 60
         seconds = self.recording_time % 60
-        self.time_display.setText(f"{minutes:02d}:{seconds:02d}")
+        
+        # The "MM:" part only changes once a minute
+        if seconds == 0:
+            self._minute_prefix = f"{self.recording_time // 60:02d}:"
+        self.time_display.setText(self._minute_prefix + SECONDS_LABELS[seconds])
         
     def start_recording(self):
         """Start recording audio from the selected device."""
@@ -1343,7 +1983,7 @@ class WhisperNotepadApp(QMainWindow):
                 self.recording_thread = RecordingThread(device_id)
                 
                 # Connect signals
-                self.recording_thread.error.connect(self.show_error)
+                self.recording_thread.error.connect(self.on_recording_error)
                 self.recording_thread.finished.connect(self.on_recording_finished)
                 
                 # Start recording
@@ -1365,6 +2005,7 @@ class WhisperNotepadApp(QMainWindow):
                 
                 # Start timer
                 self.recording_time = 0
+                self._minute_prefix = "00:"
                 self.recording_timer.start(1000)  # Update every second
                 
                 # Update status
@@ -1407,18 +2048,12 @@ class WhisperNotepadApp(QMainWindow):
     def stop_and_transcribe(self):
         """Stop the current recording and immediately start transcription."""
         if self.recording_thread:
-            # First stop the recording
+            # on_recording_finished starts the transcription as soon as the file is saved
+            self._auto_transcribe_after_stop = True
             self.recording_timer.stop()
-            self.recording_thread.stop_recording()
             self.statusBar().showMessage("Recording stopped, starting transcription...")
-            
-            # Wait a moment for the recording to be saved
-            QTimer.singleShot(500, self.check_and_transcribe)
-    
-    def check_and_transcribe(self):
-        """Check if we should transcribe and start transcription if needed."""
-        if self.temp_audio_file:
-            self.transcribe_audio()
+            self.recording_thread.stop_recording()
+            self._auto_transcribe_after_stop = False
     
     def on_recording_finished(self):
         """Handle the completion of the recording process."""
@@ -1441,10 +2076,10 @@ class WhisperNotepadApp(QMainWindow):
                 if hasattr(self, 'recording_timer'):
                     self.recording_timer.stop()
                 
-                # Auto-transcribe if enabled
-                if self.auto_transcribe_checkbox.isChecked():
+                # Transcribe straight away if requested; the file is complete at this point
+                if self._auto_transcribe_after_stop or self.auto_transcribe_checkbox.isChecked():
                     self.statusBar().showMessage("Recording finished. Auto-transcribing...")
-                    QTimer.singleShot(500, self.transcribe_audio)
+                    self.transcribe_audio()
                 else:
                     self.statusBar().showMessage("Recording finished. Ready to transcribe.")
             else:
@@ -1455,9 +2090,24 @@ class WhisperNotepadApp(QMainWindow):
                 
             # Clean up
             self.recording_thread = None
+            self.is_recording = False
         except Exception as e:
             self.show_error(f"Error finalizing recording: {str(e)}")
             
+    def on_recording_error(self, message):
+        """Show a recording error and reset the recording state if the recording has ended."""
+        self.show_error(message)
+        if self.recording_thread is not None and not self.recording_thread.recording:
+            self.recording_timer.stop()
+            self.record_button.setEnabled(True)
+            self.pause_button.setEnabled(False)
+            self.stop_button.setEnabled(False)
+            self.stop_and_transcribe_button.setEnabled(False)
+            self.device_combo.setEnabled(True)
+            self.save_default_device_button.setEnabled(True)
+            self.recording_thread = None
+            self.is_recording = False
+            
     def transcribe_audio(self):
         """Transcribe the recorded audio."""
         if not self.temp_audio_file:
@@ -1466,7 +2116,7 @@ class WhisperNotepadApp(QMainWindow):
             
         try:
             # Check if API key is set
-            if not openai.api_key:
+            if not self.openai_client.api_key:
                 self.show_error("OpenAI API key is not set. Please set it in Settings > Set OpenAI API Key.")
                 return
                 
@@ -1476,18 +2126,27 @@ class WhisperNotepadApp(QMainWindow):
             self.statusBar().showMessage("Transcribing audio...")
             
             # Create and start transcription thread
-            self.transcription_thread = TranscriptionThread(self.temp_audio_file)
+            self.transcription_thread = TranscriptionThread(
+                self.temp_audio_file, self.openai_client, use_cache=self.config.cache_transcriptions
+            )
             self.transcription_thread.finished.connect(self.on_transcription_finished)
+            self.transcription_thread.no_speech.connect(self.on_no_speech)
             self.transcription_thread.error.connect(self.show_error)
-            self.transcription_thread.progress.connect(lambda msg: self.statusBar().showMessage(msg))
+            self.transcription_thread.progress.connect(self.statusBar().showMessage)
             
-            # Start transcription in a separate thread
-            threading.Thread(target=self.transcription_thread.transcribe).start()
+            # Run transcription on a pooled Qt worker thread
+            QThreadPool.globalInstance().start(self.transcription_thread.transcribe)
         except Exception as e:
             self.transcribe_button.setText("Transcribe")
             self.transcribe_button.setEnabled(True)
             self.show_error(f"Error starting transcription: {str(e)}")
             
+    def on_no_speech(self):
+        """Handle a recording that was skipped because it contained no speech."""
+        self.transcribe_button.setText("Transcribe")
+        self.transcribe_button.setEnabled(True)
+        self.statusBar().showMessage("No speech detected. Nothing was sent for transcription.")
+            
     def on_transcription_finished(self, text):
         """Handle the completion of the transcription process."""
         try:
@@ -1496,19 +2155,44 @@ class WhisperNotepadApp(QMainWindow):
             self.transcribe_button.setEnabled(True)
             
             # Display the raw transcription
-            self.raw_text.setText(text)
+            self.set_raw_text(text)
             
-            # If cleanup is enabled, process the text
-            if self.cleanup_checkbox.isChecked():
+            # If cleanup is enabled, process the text (short memos skip the GPT round trip
+            # when the selected style would only tidy them up)
+            skip_short = self._current_style in CLEANUP_ONLY_STYLES and len(text.split()) < MIN_CLEANUP_WORDS
+            if self.cleanup_checkbox.isChecked() and not skip_short:
                 self.statusBar().showMessage("Processing transcription...")
                 self.cleanup_text(text)
             else:
                 # Otherwise, just copy the raw text to the cleaned area
-                self.cleaned_text.setText(text)
+                self.cleaned_text.setPlainText(text)
                 self.statusBar().showMessage("Transcription complete.")
         except Exception as e:
             self.show_error(f"Error processing transcription: {str(e)}")
             
+    def set_raw_text(self, text):
+        """Replace the raw transcription, adding long text in slices so the UI stays responsive."""
+        self.raw_text_timer.stop()
+        self.raw_text.clear()
+        if len(text) <= RAW_TEXT_SLICE_SIZE:
+            self.raw_text.setPlainText(text)
+            return
+        
+        self._raw_text_slices = [
+            text[i:i + RAW_TEXT_SLICE_SIZE] for i in range(0, len(text), RAW_TEXT_SLICE_SIZE)
+        ]
+        self._raw_text_slices.reverse()
+        self.raw_text_timer.start(0)
+        
+    def append_raw_text_slice(self):
+        """Append the next pending slice of the raw transcription."""
+        if self._raw_text_slices:
+            cursor = self.raw_text.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(self._raw_text_slices.pop())
+        if not self._raw_text_slices:
+            self.raw_text_timer.stop()
+        
     def cleanup_text(self, text):
         """Clean up the transcript using GPT."""
         if not text:
@@ -1516,35 +2200,103 @@ class WhisperNotepadApp(QMainWindow):
             return
         
         # Get the selected transformation style
-        transformation_style = self.transformation_combo.currentText()
+        transformation_style = self._current_style
         self.statusBar().showMessage(f"Cleaning up transcription with GPT using {transformation_style} style...")
         
-        # Start GPT cleanup
-        self.cleanup_thread = CleanupThread(text, transformation_style)
+        # Start GPT cleanup, streaming the response into the clean transcription area
+        self.cleaned_text.clear()
+        self.cleanup_thread = CleanupThread(text, self.openai_client, transformation_style)
+        self.cleanup_thread.chunk_ready.connect(self.append_cleanup_chunk)
         self.cleanup_thread.finished.connect(self.on_cleanup_finished)
         self.cleanup_thread.error.connect(self.show_error)
         
-        # Start cleanup in a new thread
-        threading.Thread(target=self.cleanup_thread.cleanup).start()
+        # Run cleanup on a pooled Qt worker thread
+        QThreadPool.globalInstance().start(self.cleanup_thread.cleanup)
 
+    def append_cleanup_chunk(self, chunk):
+        """Append a streamed piece of the GPT response to the clean transcription."""
+        # Insert through a separate cursor so the user's own cursor position is left alone
+        cursor = self.cleaned_text.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(chunk)
+        
     def on_cleanup_finished(self, text):
         """Handle the completion of the GPT cleanup process."""
-        # Update UI with cleaned text
-        self.cleaned_text.setText(text)
-        
+        # The cleaned text has already been streamed into the text area
         self.statusBar().showMessage("Transcription and cleanup complete.")
         
-        # Clean up temporary audio file
-        if self.temp_audio_file and os.path.exists(self.temp_audio_file):
-            try:
-                os.remove(self.temp_audio_file)
-                self.temp_audio_file = None
-            except Exception as e:
-                print(f"Error removing temporary file: {str(e)}")
+        # Clean up temporary audio file on a worker thread; unlinking can block on slow disks
+        if self.temp_audio_file:
+            QThreadPool.globalInstance().start(partial(self._remove_temp_file, self.temp_audio_file))
+            self.temp_audio_file = None
+                
+    @staticmethod
+    def _remove_temp_file(path):
+        """Delete a temporary file, ignoring one that is already gone."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("Error removing temporary file: %s", e)
                 
+    def apply_multiple_styles(self):
+        """Let the user pick several transformation styles and apply them in one request."""
+        text = self.raw_text.toPlainText()
+        if not text:
+            self.show_error("No text to clean up")
+            return
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Apply Multiple Styles")
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel("Select the transformation styles to apply:"))
+        
+        style_list = QListWidget()
+        for style in get_text_transformations().keys():
+            item = QListWidgetItem(style)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            style_list.addItem(item)
+        layout.addWidget(style_list)
+        
+        button_layout = QHBoxLayout()
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(dialog.reject)
+        apply_button = QPushButton("Apply")
+        apply_button.clicked.connect(dialog.accept)
+        button_layout.addWidget(cancel_button)
+        button_layout.addWidget(apply_button)
+        layout.addLayout(button_layout)
+        
+        if dialog.exec() != QDialog.Accepted:
+            return
+        
+        styles = [
+            style_list.item(i).text() for i in range(style_list.count())
+            if style_list.item(i).checkState() == Qt.Checked
+        ]
+        if not styles:
+            return
+        
+        self.statusBar().showMessage(f"Applying {len(styles)} styles with GPT...")
+        self.cleanup_thread = CleanupThread(text, self.openai_client, styles=styles)
+        self.cleanup_thread.styles_ready.connect(self.on_styles_finished)
+        self.cleanup_thread.error.connect(self.show_error)
+        
+        # Run cleanup on a pooled Qt worker thread
+        QThreadPool.globalInstance().start(self.cleanup_thread.cleanup)
+        
+    def on_styles_finished(self, results):
+        """Show each style's output in the clean transcription area under its own heading."""
+        self.cleaned_text.setPlainText("\n\n".join(
+            f"## {style}\n\n{text}" for style, text in results.items()
+        ))
+        self.statusBar().showMessage("Multi-style cleanup complete.")
+        
     def new_note(self):
         """Clear both transcription text areas."""
-        self.raw_text.clear()
+        self.set_raw_text("")
         self.cleaned_text.clear()
         self.statusBar().showMessage("New note created")
         
@@ -1561,8 +2313,7 @@ class WhisperNotepadApp(QMainWindow):
             )
             
             if file_path:
-                with open(file_path, "w") as f:
-                    f.write(text)
+                Path(file_path).write_bytes(text.encode("utf-8"))
                 self.statusBar().showMessage(f"Note saved to {file_path}")
         except Exception as e:
             self.show_error(f"Error saving note: {str(e)}")
@@ -1574,6 +2325,8 @@ class WhisperNotepadApp(QMainWindow):
             self.show_error("Nothing to save")
             return
             
+        from datetime import datetime
+        
         try:
             # Get desktop path
             desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
@@ -1582,8 +2335,7 @@ class WhisperNotepadApp(QMainWindow):
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             file_path = os.path.join(desktop_path, f"voice_note_{timestamp}.txt")
             
-            with open(file_path, "w") as f:
-                f.write(text)
+            Path(file_path).write_bytes(text.encode("utf-8"))
             self.statusBar().showMessage(f"Note saved to {file_path}")
         except Exception as e:
             self.show_error(f"Error saving note to desktop: {str(e)}")
@@ -1596,36 +2348,60 @@ class WhisperNotepadApp(QMainWindow):
             )
             
             if file_path:
-                with open(file_path, "r") as f:
-                    text = f.read()
-                self.cleaned_text.setText(text)
+                # Decode straight from a memory map so the file's bytes aren't copied first
+                with open(file_path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        text = ""
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            text = str(mm, "utf-8", "replace")
+                
+                # setPlainText so notes are never interpreted as HTML
+                self.cleaned_text.setPlainText(text)
                 self.statusBar().showMessage(f"Note loaded from {file_path}")
         except Exception as e:
             self.show_error(f"Error loading note: {str(e)}")
             
+    def _copy_raw(self):
+        """Copy the raw transcription to the clipboard."""
+        self.copy_text_to_clipboard(self.raw_text)
+        
+    def _copy_clean(self):
+        """Copy the clean transcription to the clipboard."""
+        self.copy_text_to_clipboard(self.cleaned_text)
+        
     def copy_text_to_clipboard(self, text_area):
         """Copy the text from the given text area to the clipboard."""
-        text = text_area.toPlainText()
-        if text:
-            clipboard = QApplication.clipboard()
-            clipboard.setText(text)
-            self.statusBar().showMessage("Copied to clipboard", 3000)
-        else:
+        if text_area.document().isEmpty():
             self.statusBar().showMessage("Nothing to copy", 3000)
+            return
+        
+        # Let Qt copy the whole document itself rather than building the text in Python,
+        # then put back the user's cursor and scroll position
+        original_cursor = text_area.textCursor()
+        scroll_position = text_area.verticalScrollBar().value()
+        cursor = QTextCursor(text_area.document())
+        cursor.select(QTextCursor.Document)
+        text_area.setTextCursor(cursor)
+        text_area.copy()
+        text_area.setTextCursor(original_cursor)
+        text_area.verticalScrollBar().setValue(scroll_position)
+        self.statusBar().showMessage("Copied to clipboard", 3000)
             
     def set_api_key(self):
         """Set the OpenAI API Key."""
         from PySide6.QtWidgets import QInputDialog, QLineEdit, QMessageBox
         
-        current_key = self.config.get("api_key", os.environ.get("OPENAI_API_KEY", ""))
+        current_key = self.config.api_key or ""
         api_key, ok = QInputDialog.getText(
             self, "OpenAI API Key", "Enter your OpenAI API Key:",
             QLineEdit.Password, current_key
         )
         
+        api_key = api_key.strip()
         if ok and api_key:
             # Validate the API key format (basic check)
-            if not api_key.startswith("sk-") or len(api_key) < 20:
+            if not API_KEY_PATTERN.fullmatch(api_key):
                 QMessageBox.warning(
                     self, "Invalid API Key",
                     "The API key format appears to be invalid. OpenAI API keys typically start with 'sk-' and are longer."
@@ -1633,8 +2409,8 @@ class WhisperNotepadApp(QMainWindow):
                 return
                 
             # Update the API key
-            self.config["api_key"] = api_key
-            openai.api_key = api_key
+            self.config.api_key = api_key
+            self.openai_client.api_key = api_key
             self.save_config()
             
             # Show confirmation
@@ -1660,8 +2436,8 @@ class WhisperNotepadApp(QMainWindow):
         api_key_label = QLabel("API Key:")
         api_key_input = QLineEdit()
         api_key_input.setEchoMode(QLineEdit.Password)
-        if "api_key" in self.config and self.config["api_key"]:
-            api_key_input.setText(self.config["api_key"])
+        if self.config.api_key:
+            api_key_input.setText(self.config.api_key)
         api_key_layout.addWidget(api_key_label)
         api_key_layout.addWidget(api_key_input)
         
@@ -1669,11 +2445,15 @@ class WhisperNotepadApp(QMainWindow):
         
         # Auto-transcribe option
         auto_transcribe_check = QCheckBox("Automatically transcribe after recording")
-        auto_transcribe_check.setChecked(self.config.get("auto_transcribe", False))
+        auto_transcribe_check.setChecked(bool(self.config.auto_transcribe))
         
         # SSL verification option
         ssl_verify_check = QCheckBox("Disable SSL verification (use only if having connection issues)")
-        ssl_verify_check.setChecked(self.config.get("disable_ssl_verify", False))
+        ssl_verify_check.setChecked(bool(self.config.disable_ssl_verify))
+        
+        # Transcription cache option
+        cache_check = QCheckBox("Keep past transcriptions in a local cache to skip repeat uploads")
+        cache_check.setChecked(bool(self.config.cache_transcriptions))
         
         # Buttons
         button_layout = QHBoxLayout()
@@ -1687,6 +2467,7 @@ class WhisperNotepadApp(QMainWindow):
         layout.addWidget(api_group)
         layout.addWidget(auto_transcribe_check)
         layout.addWidget(ssl_verify_check)
+        layout.addWidget(cache_check)
         layout.addStretch()
         layout.addLayout(button_layout)
         
@@ -1695,6 +2476,7 @@ class WhisperNotepadApp(QMainWindow):
             api_key_input.text(),
             auto_transcribe_check.isChecked(),
             ssl_verify_check.isChecked(),
+            cache_check.isChecked(),
             dialog
         ))
         cancel_button.clicked.connect(dialog.reject)
@@ -1702,21 +2484,23 @@ class WhisperNotepadApp(QMainWindow):
         # Show dialog
         dialog.exec()
         
-    def save_settings(self, api_key, auto_transcribe, disable_ssl_verify, dialog):
+    def save_settings(self, api_key, auto_transcribe, disable_ssl_verify, cache_transcriptions, dialog):
         """Save settings to config file."""
         # Update config
-        self.config["api_key"] = api_key
-        self.config["auto_transcribe"] = auto_transcribe
-        self.config["disable_ssl_verify"] = disable_ssl_verify
+        self.config.api_key = api_key
+        self.config.auto_transcribe = auto_transcribe
+        self.config.disable_ssl_verify = disable_ssl_verify
+        self.config.cache_transcriptions = cache_transcriptions
         
         # Save config
         self.save_config()
         
         # Update API key
-        openai.api_key = api_key
+        self.openai_client.api_key = self._resolve_api_key()
         
         # Configure SSL verification
         if disable_ssl_verify:
+            import openai
             openai.requestssession = self._get_unverified_session()
         
         # Close dialog
@@ -1725,6 +2509,17 @@ class WhisperNotepadApp(QMainWindow):
         # Show confirmation
         self.statusBar().showMessage("Settings saved", 3000)
         
+    def clear_transcription_cache(self):
+        """Delete the local transcription cache database."""
+        try:
+            # SQLite may leave a journal next to the database
+            for path in (TRANSCRIPTION_CACHE_FILE, TRANSCRIPTION_CACHE_FILE + "-journal"):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.statusBar().showMessage("Transcription cache cleared", 3000)
+        except OSError as e:
+            self.show_error(f"Error clearing transcription cache: {str(e)}")
+        
     def show_about(self):
         """Show the about dialog."""
         QMessageBox.about(
@@ -1741,42 +2536,76 @@ class WhisperNotepadApp(QMainWindow):
         
     def load_config(self):
         """Load configuration from file or create default."""
+        if WhisperNotepadApp._config_cache is not None:
+            self.config = WhisperNotepadApp._config_cache
+            return
+            
         try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, "r") as f:
-                    self.config = json.load(f)
-                    
-                    # Load custom transformations if present
-                    if "custom_transformations" in self.config:
-                        for name, prompt in self.config["custom_transformations"].items():
-                            if name not in TEXT_TRANSFORMATIONS:
-                                TEXT_TRANSFORMATIONS[name] = prompt
-            else:
-                self.config = DEFAULT_CONFIG
-        except Exception as e:
-            print(f"Error loading config: {e}")
-            self.config = DEFAULT_CONFIG
+            config_bytes = CONFIG_PATH.read_bytes()
+            self.config = Config.from_dict(_json_loads(config_bytes))
+            WhisperNotepadApp._config_on_disk = config_bytes
+            
+            # Load custom transformations if present
+            if self.config.custom_transformations:
+                transformations = get_text_transformations()
+                for name, prompt in self.config.custom_transformations.items():
+                    if name not in transformations:
+                        transformations[name] = prompt
+        except FileNotFoundError:
+            self.config = Config()
+        except (OSError, ValueError):
+            # Unreadable file or invalid JSON (both decoders raise ValueError subclasses)
+            log.exception("Error loading config")
+            self.config = Config()
+            WhisperNotepadApp._config_unreadable = True
+        
+        WhisperNotepadApp._config_cache = self.config
             
     def save_config(self):
         """Save configuration to file."""
         try:
             # Save the current transformation style
-            self.config["default_transformation"] = self.transformation_combo.currentText()
+            self.config.default_transformation = self._current_style
             
             # Save custom transformations
             custom_transformations = {}
-            for name, prompt in TEXT_TRANSFORMATIONS.items():
+            for name, prompt in get_text_transformations().items():
                 # Skip default transformations
                 if name not in ["Standard", "Email Format", "Voice Prompt", "System Prompt", 
                                "Personal Email", "Technical Documentation", "Shakespearean Style", "Minimal Cleanup"]:
                     custom_transformations[name] = prompt
                     
-            self.config["custom_transformations"] = custom_transformations
+            self.config.custom_transformations = custom_transformations
             
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(self.config, f)
-        except Exception as e:
-            print(f"Error saving config: {e}")
+            # Nothing to do if the file already holds exactly this config
+            config_bytes = _json_dumps(self.config.to_dict())
+            if config_bytes == WhisperNotepadApp._config_on_disk:
+                return
+            
+            # Keep a file that failed to load instead of replacing it with the defaults
+            if WhisperNotepadApp._config_unreadable:
+                CONFIG_PATH.replace(CONFIG_BACKUP_PATH)
+                log.warning("Moved unreadable config file to %s", CONFIG_BACKUP_PATH)
+                WhisperNotepadApp._config_unreadable = False
+            
+            # Write to a sibling file and swap it in so a crash never leaves a torn config.
+            # The new file keeps the old one's permissions, and is private if there was none,
+            # since it holds the API key.
+            try:
+                mode = CONFIG_PATH.stat().st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o600
+            fd = os.open(CONFIG_TMP_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            with os.fdopen(fd, "wb") as config_file:
+                config_file.write(config_bytes)
+            # os.open only applies the mode when it creates the file, e.g. not to a leftover .tmp
+            os.chmod(CONFIG_TMP_PATH, mode)
+            CONFIG_TMP_PATH.replace(CONFIG_PATH)
+            WhisperNotepadApp._config_cache = self.config
+            WhisperNotepadApp._config_on_disk = config_bytes
+        except (OSError, TypeError):
+            # Write failure, or a value that can't be serialized to JSON
+            log.exception("Error saving config")
             
     def browse_system_prompts(self):
         """Open the system prompt selector dialog."""
@@ -1831,8 +2660,9 @@ class WhisperNotepadApp(QMainWindow):
             name = "Minimal Cleanup"
         
         # Add to transformations if not already present
-        if name not in TEXT_TRANSFORMATIONS:
-            TEXT_TRANSFORMATIONS[name] = combined_prompt
+        transformations = get_text_transformations()
+        if name not in transformations:
+            transformations[name] = combined_prompt
             
             # Add to combo box
             self.transformation_combo.addItem(name)
@@ -1848,27 +2678,37 @@ class WhisperNotepadApp(QMainWindow):
         
     def closeEvent(self, event):
         """Handle application close event."""
-        # Save config
-        self.save_config()
+        # Save config on a worker thread so the window closes straight away; the
+        # application waits for it in aboutToQuit before exiting
+        self._config_save_thread = threading.Thread(target=self.save_config)
+        self._config_save_thread.start()
         
         # Clean up temporary audio file if it exists
-        if self.temp_audio_file and os.path.exists(self.temp_audio_file):
+        if self.temp_audio_file:
             try:
                 os.remove(self.temp_audio_file)
-            except:
+            except OSError:
                 pass
         
         event.accept()
+        
+    def wait_for_config_save(self):
+        """Block until a config save started by closeEvent has finished."""
+        if self._config_save_thread is not None:
+            self._config_save_thread.join()
+            self._config_save_thread = None
 
 
 def main():
     """Main application entry point."""
+    logging.basicConfig(level=logging.INFO)
     app = QApplication(sys.argv)
     
-    # Set application style
-    app.setStyle("Fusion")
+    # Set application style (styles can only be created once the QApplication exists)
+    app.setStyle(QStyleFactory.create("Fusion"))
     
     window = WhisperNotepadApp()
+    app.aboutToQuit.connect(window.wait_for_config_save)
     window.show()
     sys.exit(app.exec())
 